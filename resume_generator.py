@@ -1,12 +1,28 @@
+import functools
+import hashlib
+import heapq
 import json
+import mmap
+import operator
 import re
 import argparse
 import os
-from datetime import datetime
+import sys
+import threading
+from datetime import date, datetime
 from collections import Counter
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from pathlib import Path
+import jinja2
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Pre-compile regex patterns
 SKILL_PATTERNS = [
@@ -16,43 +32,155 @@ SKILL_PATTERNS = [
     r'machine learning|ml|ai|data science|nlp|computer vision',
     r'agile|scrum|kanban|waterfall|leadership|communication'
 ]
+# The skill patterns are plain alternations of literals, so they can also be matched as a vocabulary
+SKILL_TERMS = [sys.intern(term.replace('\\', '')) for pattern in SKILL_PATTERNS for term in pattern.split('|')]
+# Single flat alternation so the job description is scanned once rather than once per pattern.
+# Longest terms come first so "javascript" is tried before "java" instead of after a failed lookahead,
+# and the lookarounds stop terms matching inside longer words ("go" in "good", "scala" in "scalable")
+SKILL_RE = re.compile(
+    r'(?<!\w)(?:' + '|'.join(re.escape(term) for term in sorted(SKILL_TERMS, key=len, reverse=True)) + r')(?!\w)',
+    re.IGNORECASE
+)
+WORD_CHAR_RE = re.compile(r'\w')
+# Alphanumeric word tokenizer
+TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+# Job description files at least this large are memory-mapped rather than read in chunks
+JOB_MMAP_THRESHOLD = 64 * 1024
+# With at least this many required skills (and pyahocorasick installed), items are scored with one
+# automaton pass instead of one substring search per skill
+AUTOMATON_SCORING_THRESHOLD = 16
+# Job description analyses and styles kept per generator, oldest evicted first
+JOB_CACHE_SIZE = 128
+# Write buffer for streamed exports, large enough that a typical resume reaches disk in one write
+OUTPUT_BUFFER_SIZE = 1 << 16
+# Extensions the exporters write; only these are replaced when one output name serves several formats
+OUTPUT_EXTENSIONS = frozenset({".md", ".json", ".html", ".pdf"})
 EXP_PATTERN = re.compile(r'(\d+)[\+]?\s+years?\s+(?:of\s+)?experience')
-EDUCATION_PATTERN = re.compile(r"bachelor'?s?|master'?s?|phd|doctorate|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?")
-
-# Set NLTK data path to a writable location in the project
-nltk_data_dir = os.path.join(os.getcwd(), 'nltk_data')
-os.makedirs(nltk_data_dir, exist_ok=True)
-nltk.data.path.insert(0, nltk_data_dir)
-
-# Download NLTK resources with proper error handling
-def download_nltk_resources():
-    """Download required NLTK resources and verify they're available"""
-    # Resources needed for our processing
-    resources = ['punkt', 'stopwords', 'punkt_tab']
-    missing = []
-    
-    for resource in resources:
-        try:
-            nltk.data.find(f'tokenizers/{resource}')
-            print(f"Resource '{resource}' is already available.")
-        except LookupError:
-            missing.append(resource)
-    
-    if missing:
-        print(f"Downloading missing NLTK resources: {', '.join(missing)}")
-        for resource in missing:
-            try:
-                nltk.download(resource, download_dir=nltk_data_dir, quiet=False)
-                print(f"Successfully downloaded '{resource}'")
-            except Exception as e:
-                print(f"ERROR: Failed to download '{resource}': {e}")
-                return False
+EDUCATION_PATTERN = re.compile(r"bachelor'?s?|master'?s?|phd|doctorate|b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?", re.IGNORECASE)
+
+def build_skill_automaton(terms):
+    """Build an Aho-Corasick automaton that finds every skill term in one pass over the text"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+def is_whole_word(text, start, end):
+    """Check that text[start:end] is not embedded in a longer word, using the same rule as SKILL_RE"""
+    return ((start == 0 or not WORD_CHAR_RE.match(text, start - 1))
+            and (end == len(text) or not WORD_CHAR_RE.match(text, end)))
+
+# Fall back to SKILL_RE when pyahocorasick is not installed
+SKILL_AUTOMATON = build_skill_automaton(SKILL_TERMS) if ahocorasick else None
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, pretty=False):
+    """Serialize an object to UTF-8 encoded JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def intern_keywords(resume_data):
+    """Intern every item keyword so repeated keywords share one string object"""
+    for section in resume_data.values():
+        if not isinstance(section, list):
+            continue
+        for item in section:
+            if isinstance(item, dict) and "keywords" in item:
+                item["keywords"] = [sys.intern(kw) if isinstance(kw, str) else kw for kw in item["keywords"]]
+    return resume_data
+
+# Output templates live next to this module
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+def format_year(value):
+    """Reduce an ISO date to its year, leaving 'Present' and other dash-free values intact"""
+    return value.partition("-")[0]
+
+@functools.lru_cache(maxsize=1)
+def load_template_env():
+    """Build the template environment once per process, on first use"""
+    # Templates are compiled on first use and cached by the environment for the life of the process.
+    # The bytecode cache (in the per-user temp directory) carries the compiled code over to later runs,
+    # and templates ship with the code, so they are never re-checked for changes on disk
+    try:
+        bytecode_cache = jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        # No safe cache directory (e.g. foreign-owned or a symlink); compile in memory only
+        bytecode_cache = None
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATE_DIR),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        # HTML templates escape resume and job-description text; Markdown is emitted verbatim
+        autoescape=jinja2.select_autoescape(enabled_extensions=('html.j2',), default=False),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True
+    )
+    env.filters['year'] = format_year
+    return env
+
+# Fallbacks for any style value the style selector leaves out
+HTML_STYLE_DEFAULTS = {
+    "layout": "Professional",
+    "font": "Calibri, Arial, sans-serif",
+    "secondary_color": "#333",
+    "primary_color": "#2a5885",
+    "accent": "#777"
+}
+
+# English stopwords; contractions appear as the pieces TOKEN_RE splits them into ('don', 't')
+STOP_WORDS = frozenset([
+    'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', 'your', 'yours',
+    'yourself', 'yourselves', 'he', 'him', 'his', 'himself', 'she', 'her', 'hers', 'herself', 'it',
+    'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 'what', 'which', 'who',
+    'whom', 'this', 'that', 'these', 'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 'a', 'an', 'the', 'and',
+    'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about',
+    'against', 'between', 'into', 'through', 'during', 'before', 'after', 'above', 'below', 'to',
+    'from', 'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then',
+    'once', 'here', 'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
+    'than', 'too', 'very', 's', 't', 'can', 'will', 'just', 'don', 'should', 'now', 'd', 'll', 'm',
+    'o', 're', 've', 'y', 'ain', 'aren', 'couldn', 'didn', 'doesn', 'hadn', 'hasn', 'haven', 'isn',
+    'ma', 'mightn', 'mustn', 'needn', 'shan', 'shouldn', 'wasn', 'weren', 'won', 'wouldn'
+])
+
+@functools.lru_cache(maxsize=1)
+def load_pdf_renderer():
+    """Import WeasyPrint and build its font configuration once per process; None if not installed"""
+    # Deferred so only PDF exports pay for the import, and cached so repeated exports reuse the
+    # fontconfig setup instead of redoing it per document
+    try:
+        import weasyprint
+        from weasyprint.text.fonts import FontConfiguration
+    except (ImportError, OSError):
+        # OSError: installed, but the Pango system libraries it loads at import are missing
+        return None
+    return weasyprint, FontConfiguration()
+
+@functools.lru_cache(maxsize=1)
+def load_style_classifier():
+    """Build the style classification pipeline once per process instead of once per call"""
+    # Imported here so the (large) transformers stack only loads when a style is selected;
+    # ImportError propagates to the caller's fallback and is not cached
+    from transformers import pipeline
     
-    return True
-
-# Ensure NLTK resources are available
-if not download_nltk_resources():
-    print("WARNING: Some NLTK resources could not be downloaded. The application may not work correctly.")
+    # Create a text classification pipeline
+    return pipeline(
+        "text-classification", 
+        model="distilbert-base-uncased-finetuned-sst-2-english",  # Using a small model as example
+        return_all_scores=True
+    )
 
 class ResumeGenerator:
     """
@@ -61,8 +189,9 @@ class ResumeGenerator:
     requirements, and generate tailored resumes in JSON or Markdown formats.
     
     Attributes:
-        resume_data (dict): The resume data loaded from a JSON file or created as a template.
-        stop_words (set): A set of stop words used for text processing in job description analysis.
+        resume_data (dict): The resume data loaded from a JSON file or created as a template. Assigning it
+            re-indexes the items; items added to a section in place need index_resume_items() to be cached.
+        EXPORTERS (dict): Maps each supported output format to the method that writes it.
         
     Methods:
         __init__(resume_file='resume_data.json'):
@@ -77,20 +206,37 @@ class ResumeGenerator:
         analyze_job_description(job_description):
             Extracts key skills, requirements, and frequently mentioned 
             terms from a job description.
+        cached_job_analysis(job_description):
+            Returns the analysis of a job description (with tuple values), reusing earlier results for identical text.
         get_experience_years(work_item):
             Calculates the years of experience for a given work item based on 
             start and end dates.
-        calculate_relevance_score(item, required_skills):
+        extract_item_keywords(item):
+            Collects the lowercased keywords and highlight/summary words of a resume item.
+        item_search_text(item):
+            Returns a work or project item's keywords joined into one searchable string, indexed for resume_data items.
+        skill_search_text(skill):
+            Returns a skill entry's name and keywords joined into one searchable string, indexed for resume_data entries.
+        index_resume_items():
+            Rebuilds the search text index of every work, project and skill item whenever resume_data is assigned.
+        calculate_relevance_score(item, required_skills, search_text=None, skill_matcher=None):
             Calculates a relevance score for a resume item based on its match with job requirements.
         generate_tailored_resume(job_description):
             Generates a tailored resume by analyzing a job description and 
             sorting resume sections by relevance.
-        generate_markdown_resume(tailored_resume):
-            Generates a Markdown version of the tailored resume.
-        generate_html_resume(tailored_resume):
-            Generates an HTML version of the tailored resume with CSS styling.
-        export_tailored_resume(job_description, output_format="markdown", output_file=None, output_dir=None, page_constraints="auto"):
+        generate_tailored_resumes_async(job_descriptions):
+            Generates tailored resumes for several job descriptions concurrently.
+        generate_markdown_resume(tailored_resume, out=None):
+            Generates a Markdown version of the tailored resume, optionally writing it to a stream.
+        generate_html_resume(tailored_resume, for_pdf=False, out=None):
+            Generates an HTML version of the tailored resume with CSS styling, optionally trimmed for PDF rendering
+            or written to a stream.
+        export_tailored_resume(job_description, output_format="markdown", output_file=None, output_dir=None, page_constraints="auto", pretty=False):
             Exports a tailored resume in the specified format (JSON, Markdown, HTML, or PDF) to a file.
+        export_tailored_resumes(job_description, formats=("markdown",), output_file=None, output_dir=None, page_constraints="auto", pretty=False, base_name=None):
+            Exports one tailored resume in several formats, tailoring it only once.
+        cached_style_for_job(job_description):
+            Returns the selected style for a job description, reusing earlier results for identical text.
         select_ai_style_for_job(job_description):
             Uses a transformer model to select the optimal resume style based on job description.
         optimize_for_page_constraints(resume_data, job_description):
@@ -99,14 +245,37 @@ class ResumeGenerator:
 
     def __init__(self, resume_file='resume_data.json'):
         """Initialize the resume generator with a JSON resume file."""
+        template_env = load_template_env()
+        self._md_tpl = template_env.get_template('resume.md.j2')
+        self._html_tpl = template_env.get_template('resume.html.j2')
+        # digest of job description -> analysis / style; see _cached_for_job
+        self._analysis_cache = {}
+        self._style_cache = {}
+        # Tailoring runs on worker threads (generate_tailored_resumes_async), so inserts and evictions
+        # are serialized
+        self._job_cache_lock = threading.Lock()
+        # Assigning resume_data also indexes its items; see index_resume_items
         self.resume_data = self.load_resume_data(resume_file)
-        self.stop_words = set(stopwords.words('english'))
+
+    @property
+    def resume_data(self):
+        """The resume being tailored.
+
+        Assigning it re-indexes the items. Items edited in place are re-indexed when next scored;
+        items added to a section in place are scored uncached until index_resume_items() is called.
+        """
+        return self._resume_data
+
+    @resume_data.setter
+    def resume_data(self, resume_data):
+        # Re-index on every assignment so the search cache never holds items of a replaced resume
+        self._resume_data = resume_data
+        self.index_resume_items()
 
     def load_resume_data(self, filename):
         """Load resume data from JSON file."""
         try:
-            with open(filename, 'r') as file:
-                return json.load(file)
+            return intern_keywords(json_loads(Path(filename).read_bytes()))
         except FileNotFoundError:
             print(f"Resume file {filename} not found. Creating example template.")
             return self.create_example_template()
@@ -211,295 +380,257 @@ class ResumeGenerator:
         }
 
         # Save the template
-        with open('resume_data.json', 'w') as file:
-            json.dump(template, file, indent=2)
+        Path('resume_data.json').write_bytes(json_dumps(template, pretty=True))
 
         return template
 
     def save_resume_data(self, filename='resume_data.json'):
         """Save current resume data to JSON file."""
-        with open(filename, 'w') as file:
-            json.dump(self.resume_data, file, indent=2)
+        Path(filename).write_bytes(json_dumps(self.resume_data, pretty=True))
 
     def analyze_job_description(self, job_description):
         """Extract key skills and requirements from a job description."""
-        try:
-            # Tokenize and remove stopwords
-            tokens = word_tokenize(job_description.lower())
-            filtered_tokens = [w for w in tokens if w.isalnum() and w not in self.stop_words]
-        except LookupError as e:
-            # Fallback to simple tokenization if NLTK fails
-            print(f"Warning: NLTK tokenization failed: {e}")
-            print("Using simple tokenization instead.")
-            # Simple tokenization fallback
-            tokens = job_description.lower().split()
-            filtered_tokens = [w for w in tokens if w.isalnum() and w not in self.stop_words]
-        
-        # Count word frequency
-        word_freq = Counter(filtered_tokens)
-
-        # Extract potential skills using regex (doesn't rely on NLTK)
-        skills = set()
-        for pattern in SKILL_PATTERNS:
-            matches = re.findall(pattern, job_description.lower())
-            skills.update(matches)
+        # Lowercase once; the tokenizer and the skill automaton share this copy while the
+        # case-insensitive regexes scan the original text
+        jd_lower = job_description.lower()
+        
+        # Tokenize, drop stopwords and count word frequency in one pass, without an intermediate list
+        frequent_words = Counter(w for w in TOKEN_RE.findall(jd_lower) if w not in STOP_WORDS).most_common(15)
+
+        # Extract potential skills
+        if SKILL_AUTOMATON is not None:
+            # The automaton reports every substring hit, so keep only whole-word matches
+            skills = {
+                term for end, term in SKILL_AUTOMATON.iter(jd_lower)
+                if is_whole_word(jd_lower, end - len(term) + 1, end + 1)
+            }
+        else:
+            skills = {sys.intern(match.lower()) for match in SKILL_RE.findall(job_description)}
 
         # Look for years of experience
         experience_reqs = EXP_PATTERN.findall(job_description)
 
         # Look for education requirements
-        education_reqs = EDUCATION_PATTERN.findall(job_description.lower())
+        education_reqs = [match.lower() for match in EDUCATION_PATTERN.findall(job_description)]
 
         return {
-            "frequent_words": word_freq.most_common(15),
+            "frequent_words": frequent_words,
             "skills": list(skills),
             "experience": experience_reqs,
             "education": education_reqs
         }
 
+    def _cached_for_job(self, cache, job_description, compute):
+        """Return compute(job_description), reusing the result when the same text was seen before."""
+        # A short digest is kept as the key rather than the (possibly large) description itself
+        key = hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).digest()
+        value = cache.get(key)
+        if value is None:
+            value = compute(job_description)
+            with self._job_cache_lock:
+                if len(cache) >= JOB_CACHE_SIZE:
+                    cache.pop(next(iter(cache), None), None)
+                cache[key] = value
+        return value
+
+    def _frozen_job_analysis(self, job_description):
+        # Cached analyses are shared between results, so their lists are stored as tuples
+        analysis = self.analyze_job_description(job_description)
+        return {key: tuple(value) for key, value in analysis.items()}
+
+    def cached_job_analysis(self, job_description):
+        """Analyze a job description, reusing the result when the same text was analyzed before.
+
+        The cached values are tuples rather than lists, since the analysis is shared.
+        """
+        # The analysis depends only on the text, so it stays valid when the resume changes
+        return self._cached_for_job(self._analysis_cache, job_description, self._frozen_job_analysis)
+
+    def cached_style_for_job(self, job_description):
+        """Select a resume style, reusing the result when the same text was classified before."""
+        # Exporting one job description as HTML and PDF would otherwise run the classifier twice
+        return self._cached_for_job(self._style_cache, job_description, self.select_ai_style_for_job)
+
     def get_experience_years(self, work_item):
         """Calculate years of experience for a work item."""
-        start = datetime.strptime(work_item["startDate"], "%Y-%m-%d")
-        if work_item.get("endDate", "Present") == "Present":
-            end = datetime.now()
-        else:
-            end = datetime.strptime(work_item["endDate"], "%Y-%m-%d")
+        # Dates are ISO "YYYY-MM-DD", which date.fromisoformat parses in C without strptime's
+        # per-call format interpretation
+        start = date.fromisoformat(work_item["startDate"])
+        end = work_item.get("endDate", "Present")
+        end = date.today() if end == "Present" else date.fromisoformat(end)
 
         return (end - start).days / 365.25
 
-    def calculate_relevance_score(self, item, required_skills):
-        """Calculate relevance score for a resume item based on job requirements."""
-        score = 0
-        item_keywords = []
+    def extract_item_keywords(self, item):
+        """Collect the lowercased keywords and highlight/summary words of a resume item."""
+        item_keywords = set()
         
         # Extract keywords from the item
         if "keywords" in item:
-            item_keywords.extend(item["keywords"])
-        
-        # Process text fields with fallback mechanisms
-        def safe_tokenize(text):
-            try:
-                return word_tokenize(text.lower())
-            except LookupError:
-                # Simple fallback
-                return text.lower().split()
+            item_keywords.update(keyword.lower() for keyword in item["keywords"])
         
+        # Process text fields
         if "highlights" in item:
             for highlight in item["highlights"]:
-                words = safe_tokenize(highlight)
-                item_keywords.extend([w for w in words if w.isalnum()])
+                item_keywords.update(TOKEN_RE.findall(highlight.lower()))
         
         if "summary" in item:
-            words = safe_tokenize(item["summary"])
-            item_keywords.extend([w for w in words if w.isalnum()])
+            item_keywords.update(TOKEN_RE.findall(item["summary"].lower()))
+        
+        return item_keywords
+
+    def _cached_search_text(self, item, fingerprint, build):
+        """Return the search text of a resume item, from the index when the item belongs to resume_data."""
+        # Keyed by identity so items stay untouched; the entry holds the item so its id cannot be
+        # reused by another object. Items from elsewhere are built fresh and never cached, so
+        # callers' dicts are not kept alive
+        entry = self._search_cache.get(id(item))
+        if entry is None or entry[0] is not item:
+            return build(item)
+        # The fingerprint holds the fields the text is built from, so an item edited in place
+        # since it was indexed gets its text rebuilt
+        key = fingerprint(item)
+        if entry[1] != key:
+            entry = (item, key, build(item))
+            self._search_cache[id(item)] = entry
+        return entry[2]
+
+    @staticmethod
+    def _item_fingerprint(item):
+        return (tuple(item.get("keywords", ())), tuple(item.get("highlights", ())), item.get("summary"))
+
+    @staticmethod
+    def _skill_fingerprint(skill):
+        return (skill["name"], tuple(skill.get("keywords", ())))
+
+    def _build_item_search_text(self, item):
+        # Newlines never occur in skills, so a match cannot straddle two keywords
+        return "\n".join(self.extract_item_keywords(item))
+
+    def _build_skill_search_text(self, skill):
+        return "\n".join([skill["name"], *skill.get("keywords", [])]).lower()
+
+    def item_search_text(self, item):
+        """Return the keywords of a work or project item as one searchable string."""
+        return self._cached_search_text(item, self._item_fingerprint, self._build_item_search_text)
+
+    def skill_search_text(self, skill):
+        """Return the lowercased name and keywords of a skill entry as one searchable string."""
+        return self._cached_search_text(skill, self._skill_fingerprint, self._build_skill_search_text)
+
+    def index_resume_items(self):
+        """Build the search text of every work, project and skill item up front."""
+        # Scoring then starts from ready-made strings for every job description, including the first.
+        # The index is rebuilt from scratch, so it only ever holds items of the current resume_data
+        # (id(item) -> (item, fingerprint, search text))
+        search_cache = {}
+        for section in ("work", "projects"):
+            for item in self.resume_data.get(section, []):
+                search_cache[id(item)] = (item, self._item_fingerprint(item), self._build_item_search_text(item))
+        for skill in self.resume_data.get("skills", []):
+            search_cache[id(skill)] = (skill, self._skill_fingerprint(skill), self._build_skill_search_text(skill))
+        self._search_cache = search_cache
+
+    def calculate_relevance_score(self, item, required_skills, search_text=None, skill_matcher=None):
+        """Calculate relevance score for a resume item based on job requirements."""
+        # Nothing to match, so don't build the item's search text just to score 0
+        if not required_skills:
+            return 0
+        if search_text is None:
+            search_text = self.item_search_text(item)
         
-        # Calculate match score based on keyword overlap
-        for skill in required_skills:
-            if any(skill in keyword.lower() for keyword in item_keywords):
-                score += 1
+        # An automaton built from required_skills reports every (overlapping) hit in one pass;
+        # counting distinct skills gives the same score as the per-skill search below
+        if skill_matcher is not None:
+            return len({skill for _, skill in skill_matcher.iter(search_text)})
         
-        return score
+        # A skill scores when it appears in any keyword of the joined search text
+        return sum(1 for skill in required_skills if skill in search_text)
 
     def generate_tailored_resume(self, job_description):
         """Generate a tailored resume based on job description."""
-        # Analyze job description
-        job_analysis = self.analyze_job_description(job_description)
-        required_skills = job_analysis["skills"]
-
-        # Create a copy of the resume data
-        tailored_resume = self.resume_data.copy()
-
-        # Sort work experience by relevance
-        if "work" in tailored_resume:
-            for item in tailored_resume["work"]:
-                item["relevance_score"] = self.calculate_relevance_score(item, required_skills)
-
-            tailored_resume["work"].sort(key=lambda x: x["relevance_score"], reverse=True)
-
-            # Remove the relevance score as it's just used for sorting
-            for item in tailored_resume["work"]:
-                item.pop("relevance_score", None)
-
-        # Sort projects by relevance
-        if "projects" in tailored_resume:
-            for item in tailored_resume["projects"]:
-                item["relevance_score"] = self.calculate_relevance_score(item, required_skills)
-
-            tailored_resume["projects"].sort(key=lambda x: x["relevance_score"], reverse=True)
-
-            # Remove the relevance score
-            for item in tailored_resume["projects"]:
-                item.pop("relevance_score", None)
-
-        # Sort skills by relevance to job description
-        if "skills" in tailored_resume:
-            for skill in tailored_resume["skills"]:
-                skill["relevance_score"] = 0
-                for req_skill in required_skills:
-                    if req_skill in skill["name"].lower() or any(req_skill in kw.lower() for kw in skill.get("keywords", [])):
-                        skill["relevance_score"] += 1
-            
-            tailored_resume["skills"].sort(key=lambda x: x["relevance_score"], reverse=True)
+        # Analyze job description; re-exporting the same one in another format reuses the analysis
+        job_analysis = self.cached_job_analysis(job_description)
+        # Skills arrive lowercased and de-duplicated; freeze them once so every section shares one
+        # read-only set
+        required_skills = frozenset(job_analysis["skills"])
+        # Large skill sets are matched with an automaton built once for this job description
+        skill_matcher = None
+        if ahocorasick is not None and len(required_skills) >= AUTOMATON_SCORING_THRESHOLD:
+            skill_matcher = build_skill_automaton(required_skills)
+
+        resume_data = self.resume_data
+
+        # Rank work experience and projects by relevance into new lists of (score, item) pairs
+        def score_item(item):
+            # Search text is cached per item, so scoring further job descriptions skips tokenizing
+            return self.calculate_relevance_score(item, required_skills, self.item_search_text(item), skill_matcher)
+
+        ranked = {}
+        if not required_skills:
+            # Every score would be 0 and the stable sorts would keep the original order, so the
+            # sections are only copied
+            for section in ("work", "projects", "skills"):
+                if section in resume_data:
+                    ranked[section] = list(resume_data[section])
+        else:
+            for section in ("work", "projects"):
+                if section in resume_data:
+                    scored = [(score_item(item), item) for item in resume_data[section]]
+                    scored.sort(key=lambda pair: pair[0], reverse=True)
+                    ranked[section] = [item for _, item in scored]
+
+            # Rank skills by relevance to job description
+            if "skills" in resume_data:
+                scored = []
+                for skill in resume_data["skills"]:
+                    search_text = self.skill_search_text(skill)
+                    if skill_matcher is not None:
+                        score = len({req_skill for _, req_skill in skill_matcher.iter(search_text)})
+                    else:
+                        score = sum(1 for req_skill in required_skills if req_skill in search_text)
+                    scored.append((score, skill))
             
-            # Remove the relevance score
-            for skill in tailored_resume["skills"]:
-                skill.pop("relevance_score", None)
-        
-        # Add job analysis info
-        tailored_resume["job_analysis"] = job_analysis
-        
-        return tailored_resume
-    
-    def generate_markdown_resume(self, tailored_resume):
-        """Generate a Markdown version of the tailored resume."""
-        markdown = []
-        
-        # Header
-        basics = tailored_resume.get("basics", {})
-        markdown.append(f"# {basics.get('name', 'Your Name')}")
-        markdown.append(f"## {basics.get('label', 'Your Title')}")
-        
-        # Contact Info
-        contact_info = []
-        if "email" in basics:
-            contact_info.append(f"Email: {basics['email']}")
-        if "phone" in basics:
-            contact_info.append(f"Phone: {basics['phone']}")
-        if "website" in basics:
-            contact_info.append(f"Website: {basics['website']}")
-        
-        if contact_info:
-            markdown.append("\n" + " | ".join(contact_info) + "\n")
-        
-        # Summary
-        if "summary" in basics:
-            markdown.append("## Summary")
-            markdown.append(basics["summary"] + "\n")
+                scored.sort(key=lambda pair: pair[0], reverse=True)
+                ranked["skills"] = [skill for _, skill in scored]
         
-        # Skills
-        if "skills" in tailored_resume:
-            markdown.append("## Skills")
-            for skill in tailored_resume["skills"]:
-                markdown.append(f"- **{skill['name']}:** {', '.join(skill.get('keywords', []))}")
-            markdown.append("")
+        # Ranked sections keep their original key positions; self.resume_data is left untouched
+        tailored_resume = {key: ranked.get(key, value) for key, value in resume_data.items()}
         
-        # Work Experience
-        if "work" in tailored_resume:
-            markdown.append("## Work Experience")
-            for job in tailored_resume["work"]:
-                position = job.get("position", "")
-                company = job.get("company", "")
-                markdown.append(f"### {position} at {company}")
-                
-                dates = []
-                if "startDate" in job:
-                    start_date = job["startDate"].split("-")[0]  # Just get the year
-                    dates.append(start_date)
-                if "endDate" in job:
-                    end_date = job["endDate"].split("-")[0] if job["endDate"] != "Present" else "Present"
-                    dates.append(end_date)
-                
-                if dates:
-                    markdown.append(f"_{' - '.join(dates)}_")
-                
-                if "summary" in job:
-                    markdown.append(f"\n{job['summary']}")
-                
-                if "highlights" in job:
-                    markdown.append("\nKey Achievements:")
-                    for highlight in job["highlights"]:
-                        markdown.append(f"- {highlight}")
-                markdown.append("")
-        
-        # Projects
-        if "projects" in tailored_resume and tailored_resume["projects"]:
-            markdown.append("## Projects")
-            for project in tailored_resume["projects"]:
-                markdown.append(f"### {project.get('name', 'Project')}")
-                
-                if "description" in project:
-                    markdown.append(project["description"])
-                
-                if "highlights" in project:
-                    markdown.append("\nHighlights:")
-                    for highlight in project["highlights"]:
-                        markdown.append(f"- {highlight}")
-                
-                if "url" in project:
-                    markdown.append(f"\n[Project Link]({project['url']})")
-                markdown.append("")
+        # Add job analysis info; each result gets its own dict over the shared (immutable) values
+        tailored_resume["job_analysis"] = dict(job_analysis)
         
-        # Education
-        if "education" in tailored_resume:
-            markdown.append("## Education")
-            for edu in tailored_resume["education"]:
-                degree = edu.get("studyType", "")
-                area = edu.get("area", "")
-                institution = edu.get("institution", "")
-                markdown.append(f"### {degree} in {area}, {institution}")
-                
-                dates = []
-                if "startDate" in edu:
-                    start_date = edu["startDate"].split("-")[0]  # Just get the year
-                    dates.append(start_date)
-                if "endDate" in edu:
-                    end_date = edu["endDate"].split("-")[0]
-                    dates.append(end_date)
-                
-                if dates:
-                    markdown.append(f"_{' - '.join(dates)}_")
-                
-                if "gpa" in edu:
-                    markdown.append(f"\nGPA: {edu['gpa']}")
-                
-                if "courses" in edu and edu["courses"]:
-                    markdown.append("\nRelevant Coursework:")
-                    markdown.append(", ".join(edu["courses"]))
-                markdown.append("")
-        
-        # Certifications
-        if "certifications" in tailored_resume and tailored_resume["certifications"]:
-            markdown.append("## Certifications")
-            for cert in tailored_resume["certifications"]:
-                name = cert.get("name", "")
-                issuer = cert.get("issuer", "")
-                date = cert.get("date", "").split("-")[0] if "date" in cert else ""
-                
-                markdown.append(f"- **{name}** - {issuer} ({date})")
-            markdown.append("")
-        
-        # Job match analysis
-        if "job_analysis" in tailored_resume:
-            markdown.append("## Job Match Analysis")
-            markdown.append("_This section is for your reference and should be removed before sending the resume._\n")
-            
-            analysis = tailored_resume["job_analysis"]
-            
-            markdown.append("### Key Skills Detected")
-            for skill in analysis["skills"]:
-                markdown.append(f"- {skill}")
-            markdown.append("")
-            
-            if analysis["experience"]:
-                markdown.append("### Experience Requirements")
-                for exp in analysis["experience"]:
-                    markdown.append(f"- {exp} years of experience")
-                markdown.append("")
-            
-            if analysis["education"]:
-                markdown.append("### Education Requirements")
-                for edu in analysis["education"]:
-                    markdown.append(f"- {edu.capitalize()} degree")
-                markdown.append("")
-            
-            markdown.append("### Frequently Mentioned Terms")
-            for word, count in analysis["frequent_words"]:
-                markdown.append(f"- {word}: {count} mentions")
-        
-        return "\n".join(markdown)
+        return tailored_resume
 
-    def generate_html_resume(self, tailored_resume):
-        """Generate an HTML version with AI-selected styling and page optimization."""
+    async def generate_tailored_resumes_async(self, job_descriptions):
+        """Generate tailored resumes for several job descriptions concurrently."""
+        # Imported here so plain CLI runs don't load asyncio; any caller awaiting this has it already
+        import asyncio
+
+        # Tailoring never modifies self.resume_data, so each job description can run in its own
+        # worker thread; results come back in the order the job descriptions were given
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.generate_tailored_resume, job_description)
+              for job_description in job_descriptions)
+        )
+    
+    def generate_markdown_resume(self, tailored_resume, out=None):
+        """Generate a Markdown version of the tailored resume.
+
+        When a writable text stream is given as ``out`` the Markdown is written to it and
+        nothing is returned; otherwise the Markdown is returned as a string.
+        """
+        if out is None:
+            return self._md_tpl.render(resume=tailored_resume)
+        out.writelines(self._md_tpl.generate(resume=tailored_resume))
+
+    def generate_html_resume(self, tailored_resume, for_pdf=False, out=None):
+        """Generate an HTML version with AI-selected styling and page optimization.
+
+        With for_pdf, the page leaves out the remote web-font import and the in-browser fit
+        script, so WeasyPrint has nothing to fetch over the network. As with Markdown, the HTML
+        is written to ``out`` when a text stream is given and returned as a string otherwise.
+        """
         # Get job description and analysis
         job_analysis = tailored_resume.get("job_analysis", {})
         job_description = "Technology job with programming requirements"  # Default fallback
@@ -509,353 +640,126 @@ class ResumeGenerator:
             job_description = job_analysis["original_description"]
         
         # Get AI-recommended style
-        style = self.select_ai_style_for_job(job_description)  # Option 1: Local model
-        
-        # Use style in HTML generation
-        html = [
-            '<!DOCTYPE html>',
-            '<html lang="en">',
-            '<head>',
-            '  <meta charset="UTF-8">',
-            '  <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            f'  <title>Resume - {style.get("layout", "Professional")} Style</title>',
-            '  <style>',
-            f'    @import url("https://fonts.googleapis.com/css2?family=Roboto:wght@400;700&family=Georgia&family=Poppins:wght@400;600&family=Lato:wght@400;700&family=Libre+Baskerville&display=swap");',
-            f'    body {{ font-family: {style.get("font", "Calibri, Arial, sans-serif")}; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; color: {style.get("secondary_color", "#333")}; }}',
-            f'    h1 {{ color: {style.get("primary_color", "#2a5885")}; margin-bottom: 5px; }}',
-            f'    h2 {{ color: {style.get("primary_color", "#2a5885")}; border-bottom: 1px solid #ddd; padding-bottom: 5px; margin-top: 20px; }}',
-            '    h3 { margin-bottom: 0; }',
-            '    .contact-info { display: flex; justify-content: space-between; flex-wrap: wrap; margin-bottom: 20px; }',
-            '    .contact-item { margin-right: 20px; }',
-            f'    .date {{ color: {style.get("accent", "#777")}; font-style: italic; margin: 0; }}',
-            '    .job-title { margin-bottom: 0; }',
-            '    .company { margin-top: 0; }',
-            '    ul { padding-left: 20px; }',
-            '    li { margin-bottom: 5px; }',
-            '    .skills-container { display: flex; flex-wrap: wrap; }',
-            '    .skill-category { width: 48%; margin-right: 2%; margin-bottom: 15px; }',
-            '    .section { margin-bottom: 20px; }',
-            '    .project { margin-bottom: 15px; }',
-            '    .match-analysis { background-color: #f5f5f5; padding: 15px; border-radius: 5px; }',
-            '    @media print {',
-            '      body { padding: 0; }',
-            '      .match-analysis { display: none; }',
-            '      /* Auto-scaling based on content density */',
-            '      .dense-content { font-size: 0.9em; line-height: 1.4; }',
-            '      .very-dense-content { font-size: 0.85em; line-height: 1.3; }',
-            '    }',
-            '    /* Compact layout styles */',
-            '    .compact-layout h2 { margin-top: 12px; padding-bottom: 3px; }',
-            '    .compact-layout h3 { margin-bottom: 0; margin-top: 8px; }',
-            '    .compact-layout p { margin: 4px 0; }',
-            '    .compact-layout ul { margin: 4px 0; }',
-            '    .compact-layout li { margin-bottom: 2px; }',
-            '    .compact-layout .section { margin-bottom: 12px; }',
-            '    @page { size: letter; margin: 0.5in; }',
-            '  </style>',
-            '  <script>',
-            '    window.addEventListener("load", function() {',
-            '      // Measure content height vs page height',
-            '      function checkContentFit() {',
-            '        const contentHeight = document.body.scrollHeight;',
-            '        const pageHeight = 11 * 96; // Letter size in pixels (11 inches)',
-            '        const ratio = contentHeight / pageHeight;',
-            '        ',
-            '        // Apply different density classes based on content amount',
-            '        if (ratio > 1.3) {',
-            '          document.body.classList.add("very-dense-content");',
-            '          document.body.classList.add("compact-layout");',
-            '        } else if (ratio > 1.1) {',
-            '          document.body.classList.add("dense-content");',
-            '          document.body.classList.add("compact-layout");',
-            '        } else if (ratio > 1.0) {',
-            '          document.body.classList.add("compact-layout");',
-            '        }',
-            '      }',
-            '      ',
-            '      // Run on load and print',
-            '      checkContentFit();',
-            '      window.onbeforeprint = checkContentFit;',
-            '    });',
-            '  </script>',
-            '</head>',
-            '<body>'
-        ]
-        
-        # Header
-        basics = tailored_resume.get("basics", {})
-        html.append(f'  <div class="header-section">')
-        html.append(f'    <h1>{basics.get("name", "Your Name")}</h1>')
-        if basics.get("label"):
-            html.append(f'    <p>{basics.get("label")}</p>')
-        
-        # Contact Info
-        html.append('    <div class="contact-info">')
-        if "email" in basics:
-            html.append(f'      <div class="contact-item">📧 {basics["email"]}</div>')
-        if "phone" in basics:
-            html.append(f'      <div class="contact-item">📱 {basics["phone"]}</div>')
-        if "website" in basics:
-            html.append(f'      <div class="contact-item">🌐 <a href="{basics["website"]}">{basics["website"]}</a></div>')
-        if "location" in basics:
-            location = basics["location"]
-            location_str = f'{location.get("city", "")}, {location.get("region", "")}'
-            html.append(f'      <div class="contact-item">📍 {location_str}</div>')
-        html.append('    </div>')
-        
-        # Profiles
-        if "profiles" in basics and basics["profiles"]:
-            html.append('    <div class="contact-info">')
-            for profile in basics["profiles"]:
-                html.append(f'      <div class="contact-item">{profile["network"]}: <a href="{profile["url"]}">{profile.get("username", "Profile")}</a></div>')
-            html.append('    </div>')
-        html.append('  </div>')
-        
-        # Summary
-        if "summary" in basics:
-            html.append('  <div class="section">')
-            html.append('    <h2>Summary</h2>')
-            html.append(f'    <p>{basics["summary"]}</p>')
-            html.append('  </div>')
-        
-        # Skills
-        if "skills" in tailored_resume and tailored_resume["skills"]:
-            html.append('  <div class="section">')
-            html.append('    <h2>Skills</h2>')
-            html.append('    <div class="skills-container">')
-            
-            for skill in tailored_resume["skills"]:
-                html.append('      <div class="skill-category">')
-                html.append(f'        <h3>{skill["name"]}</h3>')
-                if "keywords" in skill and skill["keywords"]:
-                    html.append('        <ul>')
-                    for keyword in skill["keywords"]:
-                        html.append(f'          <li>{keyword}</li>')
-                    html.append('        </ul>')
-                html.append('      </div>')
-            
-            html.append('    </div>')
-            html.append('  </div>')
-        
-        # Work Experience
-        if "work" in tailored_resume and tailored_resume["work"]:
-            html.append('  <div class="section">')
-            html.append('    <h2>Work Experience</h2>')
-            
-            for job in tailored_resume["work"]:
-                html.append('    <div class="job">')
-                position = job.get("position", "")
-                company = job.get("company", "") or job.get("name", "")  # Try both fields
-                
-                html.append(f'      <h3>{position}</h3>')
-                html.append(f'      <p class="company">{company}</p>')
-                
-                dates = []
-                if "startDate" in job:
-                    start_date = job["startDate"].split("-")[0] if "-" in job["startDate"] else job["startDate"]
-                    dates.append(start_date)
-                if "endDate" in job:
-                    end_date = job["endDate"].split("-")[0] if "-" in job["endDate"] else job["endDate"]
-                    dates.append(end_date)
-                
-                if dates:
-                    html.append(f'      <p class="date">{" - ".join(dates)}</p>')
-                
-                if "summary" in job:
-                    html.append(f'      <p>{job["summary"]}</p>')
-                
-                if "highlights" in job and job["highlights"]:
-                    html.append('      <ul>')
-                    for highlight in job["highlights"]:
-                        html.append(f'        <li>{highlight}</li>')
-                    html.append('      </ul>')
-                
-                html.append('    </div>')
-            
-            html.append('  </div>')
-        
-        # Education
-        if "education" in tailored_resume and tailored_resume["education"]:
-            html.append('  <div class="section">')
-            html.append('    <h2>Education</h2>')
-            
-            for edu in tailored_resume["education"]:
-                html.append('    <div class="education">')
-                degree = edu.get("studyType", "")
-                area = edu.get("area", "")
-                institution = edu.get("institution", "")
-                
-                html.append(f'      <h3>{degree} in {area}</h3>')
-                html.append(f'      <p class="company">{institution}</p>')
-                
-                dates = []
-                if "startDate" in edu:
-                    start_date = edu["startDate"].split("-")[0] if "-" in edu["startDate"] else edu["startDate"]
-                    dates.append(start_date)
-                if "endDate" in edu:
-                    end_date = edu["endDate"].split("-")[0] if "-" in edu["endDate"] else edu["endDate"]
-                    dates.append(end_date)
-                
-                if dates:
-                    html.append(f'      <p class="date">{" - ".join(dates)}</p>')
-                
-                if "gpa" in edu:
-                    html.append(f'      <p>GPA: {edu["gpa"]}</p>')
-                
-                if "courses" in edu and edu["courses"]:
-                    html.append('      <p><strong>Relevant Coursework:</strong></p>')
-                    html.append('      <ul>')
-                    for course in edu["courses"]:
-                        html.append(f'        <li>{course}</li>')
-                    html.append('      </ul>')
-                
-                html.append('    </div>')
-            
-            html.append('  </div>')
-        
-        # Projects
-        if "projects" in tailored_resume and tailored_resume["projects"]:
-            html.append('  <div class="section">')
-            html.append('    <h2>Projects</h2>')
-            
-            for project in tailored_resume["projects"]:
-                html.append('    <div class="project">')
-                html.append(f'      <h3>{project.get("name", "")}</h3>')
-                
-                if "description" in project:
-                    html.append(f'      <p>{project["description"]}</p>')
-                
-                if "highlights" in project and project["highlights"]:
-                    html.append('      <ul>')
-                    for highlight in project["highlights"]:
-                        html.append(f'        <li>{highlight}</li>')
-                    html.append('      </ul>')
-                
-                if "url" in project:
-                    html.append(f'      <p><a href="{project["url"]}" target="_blank">Project Link</a></p>')
-                
-                html.append('    </div>')
-            
-            html.append('  </div>')
-        
-        # Job Match Analysis
-        if "job_analysis" in tailored_resume:
-            html.append('  <div class="section match-analysis">')
-            html.append('    <h2>Job Match Analysis</h2>')
-            html.append('    <p><em>This section is for your reference and will not appear when printed.</em></p>')
-            
-            analysis = tailored_resume["job_analysis"]
-            
-            if analysis["skills"]:
-                html.append('    <h3>Key Skills Detected</h3>')
-                html.append('    <ul>')
-                for skill in analysis["skills"]:
-                    html.append(f'      <li>{skill}</li>')
-                html.append('    </ul>')
-            
-            if analysis["experience"]:
-                html.append('    <h3>Experience Requirements</h3>')
-                html.append('    <ul>')
-                for exp in analysis["experience"]:
-                    html.append(f'      <li>{exp} years of experience</li>')
-                html.append('    </ul>')
-            
-            if analysis["education"]:
-                html.append('    <h3>Education Requirements</h3>')
-                html.append('    <ul>')
-                for edu in analysis["education"]:
-                    html.append(f'      <li>{edu.capitalize()} degree</li>')
-                html.append('    </ul>')
-            
-            html.append('    <h3>Frequently Mentioned Terms</h3>')
-            html.append('    <ul>')
-            for word, count in analysis["frequent_words"]:
-                html.append(f'      <li>{word}: {count} mentions</li>')
-            html.append('    </ul>')
-            
-            html.append('  </div>')
-        
-        html.append('</body>')
-        html.append('</html>')
-        
-        return '\n'.join(html)
+        style = self.cached_style_for_job(job_description)  # Option 1: Local model
+        
+        # Fill gaps in the selected style, then render; resume content is HTML-escaped by the template
+        context = {"resume": tailored_resume, "style": {**HTML_STYLE_DEFAULTS, **style}, "for_pdf": for_pdf}
+        if out is None:
+            return self._html_tpl.render(context)
+        out.writelines(self._html_tpl.generate(context))
+
+    def _export_json(self, tailored_resume, file_path_for, pretty):
+        # Compact by default; indenting is noticeably slower and only matters for human readers.
+        # The serializer already produces UTF-8, so the bytes go to disk as they are
+        data = json_dumps(tailored_resume, pretty)
+        file_path = file_path_for("json")
+        Path(file_path).write_bytes(data)
+        return file_path, data.decode('utf-8')
+
+    def _export_markdown(self, tailored_resume, file_path_for, pretty):
+        # Streamed straight into the output file
+        file_path = file_path_for("md")
+        with open(file_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as file:
+            self.generate_markdown_resume(tailored_resume, file)
+        return file_path, None
+
+    def _export_html(self, tailored_resume, file_path_for, pretty):
+        # Streamed like Markdown; PDF still needs the whole page as one string
+        file_path = file_path_for("html")
+        with open(file_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as file:
+            self.generate_html_resume(tailored_resume, out=file)
+        return file_path, None
+
+    def _export_pdf(self, tailored_resume, file_path_for, pretty):
+        pdf_renderer = load_pdf_renderer()
+        if pdf_renderer is None:
+            print("WARNING: WeasyPrint not installed. Falling back to HTML output.")
+            print("To enable PDF output, install WeasyPrint with: pip install weasyprint")
+            output = self.generate_html_resume(tailored_resume)
+            file_path = file_path_for("html")
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(output)
+            return file_path, output
+
+        # Render the print variant of the HTML and hand it to WeasyPrint directly
+        weasyprint, font_config = pdf_renderer
+        output = self.generate_html_resume(tailored_resume, for_pdf=True)
+        file_path = file_path_for("pdf")
+        weasyprint.HTML(string=output).write_pdf(file_path, font_config=font_config)
+        return file_path, output
+
+    # Output format -> exporter; each writes the file and returns its path and content
+    EXPORTERS = {
+        "markdown": _export_markdown,
+        "json": _export_json,
+        "html": _export_html,
+        "pdf": _export_pdf
+    }
+
+    def export_tailored_resume(self, job_description, output_format="markdown", output_file=None, output_dir=None, page_constraints="auto", pretty=False):
+        """Export a tailored resume in the specified format with page constraints.
+
+        Returns the written file path and the generated content. Markdown and HTML are
+        streamed to the file as they are generated, so their content is returned as None.
+        """
+        return self.export_tailored_resumes(
+            job_description, (output_format,), output_file, output_dir, page_constraints, pretty
+        )[0]
+
+    def export_tailored_resumes(self, job_description, formats=("markdown",), output_file=None, output_dir=None, page_constraints="auto", pretty=False, base_name=None):
+        """Export one tailored resume in each of the given formats.
+
+        The resume is tailored and fitted to the page once and shared by every format. Each file is
+        named output_file with the format's extension: a format extension (.md, .json, .html, .pdf)
+        already on output_file is replaced, and anything else ("my.resume") is kept and extended.
+        base_name, when given instead of output_file, always gets the extension appended. Returns a
+        list of (file path, content) pairs in the order of formats, as export_tailored_resume does.
+        """
+        # Reject unknown formats before doing any work or writing any file
+        exporters = []
+        for output_format in formats:
+            exporter = self.EXPORTERS.get(output_format)
+            if exporter is None:
+                raise ValueError(f"Unsupported output format: {output_format}")
+            exporters.append(exporter)
 
-    def export_tailored_resume(self, job_description, output_format="markdown", output_file=None, output_dir=None, page_constraints="auto"):
-        """Export a tailored resume in the specified format with page constraints."""
         tailored_resume = self.generate_tailored_resume(job_description)
         
         # Apply page constraints if needed
         if page_constraints in ["single-page", "auto"]:
             tailored_resume = self.optimize_for_page_constraints(tailored_resume, job_description)
         
-        if output_format == "json":
-            output = json.dumps(tailored_resume, indent=2)
-            file_extension = "json"
-        elif output_format == "markdown":
-            output = self.generate_markdown_resume(tailored_resume)
-            file_extension = "md"
-        elif output_format == "html":
-            output = self.generate_html_resume(tailored_resume)
-            file_extension = "html"
-        elif output_format == "pdf":
-            # Generate HTML first
-            html_content = self.generate_html_resume(tailored_resume)
-            file_extension = "pdf"
+        # Name shared by the files of every format; only a format extension is stripped from
+        # output_file, so "senior.engineer" does not become "senior"
+        if not base_name:
+            if output_file:
+                stem, suffix = os.path.splitext(output_file)
+                base_name = stem if suffix.lower() in OUTPUT_EXTENSIONS else output_file
+            else:
+                base_name = f"tailored_resume_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        def file_path_for(file_extension):
+            # Determine file name
+            file_name = f"{base_name}.{file_extension}"
             
-            try:
-                import weasyprint
-                output = html_content  # We'll use this HTML directly when creating the PDF file
-            except ImportError:
-                print("WARNING: WeasyPrint not installed. Falling back to HTML output.")
-                print("To enable PDF output, install WeasyPrint with: pip install weasyprint")
-                output = html_content
-                file_extension = "html"
-        else:
-            raise ValueError(f"Unsupported output format: {output_format}")
-        
-        # Determine file name
-        if output_file:
-            file_name = output_file if "." in output_file else f"{output_file}.{file_extension}"
-        else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_name = f"tailored_resume_{timestamp}.{file_extension}"
-        
-        # Handle directory
-        if output_dir:
-            # Create directory if it doesn't exist
-            os.makedirs(output_dir, exist_ok=True)
-            file_path = os.path.join(output_dir, file_name)
-        else:
-            file_path = file_name
-        
-        # Write the file based on format
-        if output_format == "pdf":
-            try:
-                import weasyprint
-                html = weasyprint.HTML(string=output)
-                html.write_pdf(file_path)
-            except ImportError:
-                # Already handled above
-                with open(file_path, 'w') as file:
-                    file.write(output)
-        else:
-            with open(file_path, 'w') as file:
-                file.write(output)
-        
-        print(f"Resume exported to {file_path}")
-        return file_path, output
+            # Handle directory
+            if output_dir:
+                # Create directory if it doesn't exist
+                os.makedirs(output_dir, exist_ok=True)
+                return os.path.join(output_dir, file_name)
+            return file_name
+        
+        results = []
+        for exporter in exporters:
+            file_path, output = exporter(self, tailored_resume, file_path_for, pretty)
+            print(f"Resume exported to {file_path}")
+            results.append((file_path, output))
+        return results
 
     def select_ai_style_for_job(self, job_description):
         """Use a transformer model to select the optimal resume style."""
         try:
-            from transformers import pipeline
-            
-            # Create a text classification pipeline
-            classifier = pipeline(
-                "text-classification", 
-                model="distilbert-base-uncased-finetuned-sst-2-english",  # Using a small model as example
-                return_all_scores=True
-            )
+            classifier = load_style_classifier()
             
             # Define industry categories that influence style
             industries = [
@@ -867,12 +771,12 @@ class ResumeGenerator:
                 "academic research science education"
             ]
             
-            # Use model to calculate relevance scores for each industry
+            # Use model to calculate relevance scores for each industry, classifying all the
+            # industry prompts in one batched call instead of one forward pass each
+            results = classifier([f"This job is related to {industry}" for industry in industries])
             scores = {}
-            for industry in industries:
-                # Compare job description with industry keywords
-                result = classifier(f"This job is related to {industry}")
-                pos_score = [r['score'] for r in result[0] if r['label'] == 'POSITIVE'][0]
+            for industry, result in zip(industries, results):
+                pos_score = [r['score'] for r in result if r['label'] == 'POSITIVE'][0]
                 scores[industry] = pos_score
             
             # Find best matching industry
@@ -941,12 +845,25 @@ class ResumeGenerator:
 
     def optimize_for_page_constraints(self, resume_data, job_description):
         """Optimize resume content to fit on a single page."""
-        # Create a deep copy of the resume data
-        optimized = json.loads(json.dumps(resume_data))
-        
-        # Get job analysis
+        # Only basics and the work items are modified below, so only they are copied
+        optimized = dict(resume_data)
+        if "basics" in optimized:
+            optimized["basics"] = dict(optimized["basics"])
+        if "work" in optimized:
+            optimized["work"] = [dict(item) for item in optimized["work"]]
+        
+        # Get job analysis; skills are lowercased once
         job_analysis = resume_data.get("job_analysis", {})
-        required_skills = job_analysis.get("skills", [])
+        required_skills = [skill.lower() for skill in job_analysis.get("skills", [])]
+        # Count the distinct required skills found in a (lowercased) text; large skill sets are
+        # matched in one automaton pass instead of one substring search per skill
+        if ahocorasick is not None and len(required_skills) >= AUTOMATON_SCORING_THRESHOLD:
+            skill_matcher = build_skill_automaton(required_skills)
+            def count_skills(text):
+                return len({skill for _, skill in skill_matcher.iter(text)})
+        else:
+            def count_skills(text):
+                return sum(1 for skill in required_skills if skill in text)
         
         # 1. Calculate total content size
         content_size = 0
@@ -958,13 +875,13 @@ class ResumeGenerator:
         work_items = optimized.get("work", [])
         for item in work_items:
             content_size += len(str(item.get("summary", "")))
-            content_size += sum(len(h) for h in item.get("highlights", []))
+            content_size += sum(map(len, item.get("highlights", [])))
         
         # Count project content
         projects = optimized.get("projects", [])
         for proj in projects:
             content_size += len(str(proj.get("description", "")))
-            content_size += sum(len(h) for h in proj.get("highlights", []))
+            content_size += sum(map(len, proj.get("highlights", [])))
         
         # 2. Set thresholds for trimming
         # Typical single page can fit around 2500-3000 characters with normal formatting
@@ -997,57 +914,94 @@ class ResumeGenerator:
                 # Score highlights by relevance to job description
                 scored_highlights = []
                 for highlight in item["highlights"]:
-                    score = sum(1 for skill in required_skills if skill.lower() in highlight.lower())
-                    scored_highlights.append((highlight, score))
+                    scored_highlights.append((highlight, count_skills(highlight.lower())))
                 
-                # Sort by score and keep only the highest scoring ones
-                item["highlights"] = [h[0] for h in sorted(scored_highlights, 
-                                                          key=lambda x: x[1], 
-                                                          reverse=True)[:highlight_limit]]
+                # Keep only the highest scoring ones; nlargest breaks ties in original order, like
+                # a stable reverse sort
+                item["highlights"] = [h[0] for h in heapq.nlargest(highlight_limit, scored_highlights,
+                                                                   key=operator.itemgetter(1))]
         
         # Limit projects to the most relevant ones
         if len(projects) > project_limit:
-            # Score projects by relevance
+            # Score projects by relevance without modifying the shared project dicts
+            scored_projects = []
             for proj in projects:
-                proj["_relevance"] = sum(1 for skill in required_skills 
-                                        if skill.lower() in str(proj).lower())
+                scored_projects.append((count_skills(str(proj).lower()), proj))
             
             # Keep only the most relevant projects
-            optimized["projects"] = sorted(projects, 
-                                          key=lambda x: x["_relevance"], 
-                                          reverse=True)[:project_limit]
-            
-            # Remove the temporary scoring attribute
-            for proj in optimized["projects"]:
-                if "_relevance" in proj:
-                    proj.pop("_relevance")
+            optimized["projects"] = [proj for _, proj in heapq.nlargest(project_limit, scored_projects,
+                                                                        key=operator.itemgetter(0))]
         
         return optimized
 
 
+def read_job_description(path):
+    """Read a job description file, memory-mapping large files"""
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < JOB_MMAP_THRESHOLD:
+            return file.read().decode('utf-8')
+        # Decode straight from the mapped pages
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return str(view, 'utf-8')
+
+
+def export_job_file(resume_file, job_path, formats, output_dir, page_constraints, pretty):
+    """Export one tailored resume per format for a job description file, named after that file"""
+    # Runs in a worker process, so it builds its own generator
+    generator = ResumeGenerator(resume_file)
+    job_description = read_job_description(job_path)
+    # The stem is a base name, not a file name: "senior.engineer.txt" must still get an extension
+    results = generator.export_tailored_resumes(
+        job_description, formats, output_dir=output_dir, page_constraints=page_constraints, pretty=pretty,
+        base_name=Path(job_path).stem
+    )
+    return [file_path for file_path, _ in results]
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate a tailored resume from JSON data.')
     parser.add_argument('--resume', default='resume_data.json', help='Path to the JSON resume data file')
-    parser.add_argument('--job', required=True, help='Path to a text file containing the job description')
-    parser.add_argument('--output', help='Output file name')
+    jobs = parser.add_mutually_exclusive_group(required=True)
+    jobs.add_argument('--job', help='Path to a text file containing the job description')
+    jobs.add_argument('--jobs', help='Directory of job description .txt files; one resume is exported per file')
+    parser.add_argument('--output', help='Output file name; each format\'s extension replaces a .md/.json/.html/.pdf '
+                        'suffix or is appended (ignored with --jobs, which names files after each job)')
     parser.add_argument('--output-dir', help='Target directory for the generated resume')
-    parser.add_argument('--format', default='markdown', choices=['markdown', 'json', 'html', 'pdf'], 
-                        help='Output format')
+    parser.add_argument('--format', nargs='+', default=['markdown'], choices=list(ResumeGenerator.EXPORTERS), 
+                        help='Output format(s); several formats share one tailored resume')
     parser.add_argument('--page-limit', default='auto', choices=['auto', 'single-page', 'multi-page'],
                         help='Page limit constraints')
+    parser.add_argument('--pretty', action='store_true', help='Indent JSON output for readability')
 
     args = parser.parse_args()
 
+    if args.jobs:
+        job_paths = sorted(Path(args.jobs).glob('*.txt'))
+        if not job_paths:
+            print(f"No job description files found in {args.jobs}.")
+            return
+        export_args = (args.format, args.output_dir, args.page_limit, args.pretty)
+        if len(job_paths) == 1:
+            export_job_file(args.resume, job_paths[0], *export_args)
+            return
+        # Rendering (PDF especially) is CPU-bound and holds the GIL, so spread the jobs over processes.
+        # The process pool machinery is only imported for this batch path
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(job_paths))) as executor:
+            futures = [executor.submit(export_job_file, args.resume, path, *export_args) for path in job_paths]
+            for future in futures:
+                future.result()
+        return
+
     try:
-        with open(args.job, 'r') as file:
-            job_description = file.read()
+        job_description = read_job_description(args.job)
     except FileNotFoundError:
         print(f"Job description file {args.job} not found.")
         return
 
     generator = ResumeGenerator(args.resume)
-    generator.export_tailored_resume(job_description, args.format, args.output, args.output_dir, args.page_limit)
+    generator.export_tailored_resumes(job_description, args.format, args.output, args.output_dir, args.page_limit, args.pretty)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()